@@ -1,12 +1,14 @@
+import bisect
+import itertools
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from browser.controller import BrowserController
 from browser.dom_utils import DOMExtractor
 
 logger = logging.getLogger(__name__)
 
-CHARS_PER_TOKEN = 4
+BYTES_PER_TOKEN = 3
 
 
 class ContextManager:
@@ -17,59 +19,84 @@ class ContextManager:
         self.token_limit = token_limit
         self.extractor = DOMExtractor(browser.page)
 
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_key: Optional[tuple] = None
+
     def get_current_context(self) -> Dict[str, Any]:
         """Get the current page context in a format suitable for the agent.
 
         Uses hybrid approach: accessibility tree + on-demand HTML.
+        The result is reused while the browser state version and the page
+        signature (document, DOM mutation count, form values) are unchanged.
+        The signature is only fetched when the state version still matches;
+        after an action the page is re-extracted straight away.
 
         Returns:
             Dict with url, title, overview, estimated_tokens, was_truncated
         """
-        overview = self.extractor.get_page_overview()
+        state_version = self.browser.state_version
+        if self._cache is not None and self._cache_key[0] == state_version:
+            signature = self.extractor.get_page_signature()
+            if (state_version, *signature) == self._cache_key:
+                return self._cache
+
+        overview, signature = self.extractor.get_page_overview_with_signature()
+        url, title = signature[:2]
+        lines = overview.split("\n")
 
-        estimated_tokens = len(overview) // CHARS_PER_TOKEN
+        estimated_tokens = self._estimate_tokens(overview)
         was_truncated = False
 
         if estimated_tokens > self.token_limit:
-            overview, was_truncated = self._truncate_overview(overview)
-            new_tokens = len(overview) // CHARS_PER_TOKEN
+            lines, was_truncated = self._truncate_overview(lines)
+            overview = "\n".join(lines)
+            new_tokens = self._estimate_tokens(overview)
             logger.warning(
                 f"Context truncated: {estimated_tokens} tokens → {new_tokens} tokens"
             )
             estimated_tokens = new_tokens
 
-        return {
-            "url": self.browser.get_current_url(),
-            "title": self.browser.get_title(),
+        self._cache = {
+            "url": url,
+            "title": title,
             "overview": overview,
             "estimated_tokens": estimated_tokens,
             "was_truncated": was_truncated,
         }
+        self._cache_key = (state_version, *signature)
+        return self._cache
+
+    def invalidate(self) -> None:
+        """Drop cached context so the next fetch re-extracts the page."""
+        self._cache = None
+        self._cache_key = None
 
-    def _truncate_overview(self, overview: str) -> tuple[str, bool]:
-        """Truncate overview to fit within token limit.
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Estimate token count from UTF-8 byte length.
+
+        Byte length tracks BPE token counts more closely than character
+        count for non-Latin (e.g. Cyrillic) pages.
+        """
+        return len(text.encode("utf-8")) // BYTES_PER_TOKEN
+
+    def _truncate_overview(self, lines: List[str]) -> tuple[List[str], bool]:
+        """Truncate overview lines to fit within token limit.
 
         Args:
-            overview: Original overview text
+            lines: Original overview split into lines
 
         Returns:
-            Tuple of (truncated_overview, was_truncated)
+            Tuple of (truncated_lines, was_truncated)
         """
-        lines = overview.split("\n")
-        truncated_lines = []
-        current_tokens = 0
-
-        for line in lines:
-            line_tokens = len(line) // CHARS_PER_TOKEN
-            if current_tokens + line_tokens > self.token_limit:
-                truncated_lines.append(
-                    f"... (truncated, {len(lines) - len(truncated_lines)} lines omitted)"
-                )
-                break
-            truncated_lines.append(line)
-            current_tokens += line_tokens
-
-        return "\n".join(truncated_lines), True
+        line_bytes = [len(line.encode("utf-8")) for line in lines]
+        cumulative_bytes = list(itertools.accumulate(line_bytes))
+        cut = bisect.bisect_right(cumulative_bytes, self.token_limit * BYTES_PER_TOKEN)
+
+        if cut >= len(lines):
+            return lines, True
+
+        return lines[:cut] + [f"... (truncated, {len(lines) - cut} lines omitted)"], True
 
     def get_element_details(self, selector: str) -> str:
         """Get detailed information about a specific element."""
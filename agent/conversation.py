@@ -0,0 +1,104 @@
+from typing import Any, List
+
+from anthropic.types import MessageParam
+
+from llm.claude_client import ClaudeClient
+from llm.prompts import get_conversation_summary_prompt
+from utils.logger import logger
+
+SUMMARY_PREFIX = "Summary of earlier steps (older messages were compacted):\n"
+MAX_RENDERED_RESULT_CHARS = 500
+
+
+class ConversationCompactor:
+    """Rolls the oldest part of a long conversation into one summary message.
+
+    The first prefix_len messages (task statement) are never touched, so the
+    prompt-cache prefix stays stable. The summarized range always ends right
+    before an assistant message, which keeps every tool_use paired with its
+    tool_result.
+    """
+
+    def __init__(
+        self,
+        claude_client: ClaudeClient,
+        max_messages: int = 40,
+        prefix_len: int = 1,
+    ):
+        self.claude_client = claude_client
+        self.max_messages = max_messages
+        self.prefix_len = prefix_len
+
+    def compact(self, conversation: List[MessageParam]) -> int:
+        """Compact the conversation in place if it grew past max_messages.
+
+        Args:
+            conversation: Conversation history to compact
+
+        Returns:
+            Number of messages removed (0 if nothing was compacted)
+        """
+        if len(conversation) <= self.max_messages:
+            return 0
+
+        midpoint = self.prefix_len + (len(conversation) - self.prefix_len) // 2
+        cut = next(
+            (
+                i
+                for i in range(midpoint, len(conversation))
+                if conversation[i]["role"] == "assistant"
+            ),
+            None,
+        )
+        if cut is None:
+            return 0
+
+        old_messages = conversation[self.prefix_len:cut]
+        try:
+            summary = self._summarize(old_messages)
+        except Exception as e:
+            logger.warning(f"Failed to compact conversation: {str(e)}")
+            return 0
+
+        conversation[self.prefix_len:cut] = [
+            {"role": "user", "content": SUMMARY_PREFIX + summary}
+        ]
+        removed = len(old_messages) - 1
+        logger.info(f"Compacted {len(old_messages)} old messages into a summary")
+        return removed
+
+    def _summarize(self, messages: List[MessageParam]) -> str:
+        """Ask Claude for a short summary of the given messages."""
+        transcript = "\n".join(self._render_message(message) for message in messages)
+        response = self.claude_client.send_message(
+            messages=[{"role": "user", "content": transcript}],
+            system_prompt=get_conversation_summary_prompt(),
+            max_tokens=1024,
+        )
+        return self.claude_client.extract_text(response)
+
+    def _render_message(self, message: MessageParam) -> str:
+        """Render a message as plain transcript text."""
+        content = message["content"]
+        if isinstance(content, str):
+            return f"[{message['role']}] {content[:MAX_RENDERED_RESULT_CHARS]}"
+
+        parts = [self._render_block(block) for block in content]
+        return f"[{message['role']}] " + "\n".join(part for part in parts if part)
+
+    @staticmethod
+    def _render_block(block: Any) -> str:
+        """Render a content block (SDK object or plain dict) as text."""
+        def field(name: str) -> Any:
+            if isinstance(block, dict):
+                return block.get(name)
+            return getattr(block, name, None)
+
+        block_type = field("type")
+        if block_type == "text":
+            return field("text") or ""
+        if block_type == "tool_use":
+            return f"tool_use {field('name')}({field('input')})"
+        if block_type == "tool_result":
+            return f"tool_result: {str(field('content'))[:MAX_RENDERED_RESULT_CHARS]}"
+        return ""
@@ -1,9 +1,14 @@
-from typing import Dict, List, Optional
+import logging
+import re
+import sys
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 from anthropic.types import MessageParam
 
 from agent.context_manager import ContextManager
-from agent.tools import create_coordinator_tools
+from agent.conversation import ConversationCompactor
+from agent.tools import ToolResult, create_coordinator_tools
 from browser.controller import BrowserController
 from config import AgentConfig
 from llm.claude_client import ClaudeClient
@@ -12,11 +17,61 @@ from utils.logger import logger
 
 MAX_NO_TOOL_RETRIES = 3
 MAX_CONSECUTIVE_FAILURES = 3
+MAX_CONTEXT_MESSAGES = 3
 
-CONFIRMATION_REQUIRED = "CONFIRMATION_REQUIRED:"
-HUMAN_INTERVENTION_REQUIRED = "HUMAN_INTERVENTION_REQUIRED:"
 TASK_COMPLETE_PREFIX = "TASK_COMPLETE:"
 
+RETRY_HINT_NO_TOOLS = """You didn't provide any tool calls in your last response. To continue with the task, you MUST call one of the available tools.
+
+Please analyze the current situation and choose the next action. What tool should you use to make progress on the task?"""
+
+RETRY_HINT_TOOLS_LIST = """You still haven't provided any tool calls. You MUST use one of the available tools to continue.
+
+Available tools:
+{tools_list}
+
+Based on the current page context and the task goal, which tool should you call next? Please make a decision and call a tool."""
+
+RETRY_HINT_FINAL = """This is the final attempt. You MUST call a tool or use task_complete if the task is done.
+
+If you cannot proceed due to:
+- Missing information: Use get_page_overview or get_element_details to gather more info
+- Uncertainty: Make your best guess based on available context
+- Task completion: Use task_complete with a summary
+
+Please call a tool now."""
+
+_PAGE_CHANGING_TOOLS = frozenset(
+    {"click", "navigate_to", "scroll", "type_text", "press_key"}
+)
+_RISK_EMOJI = {
+    "financial": "💰",
+    "deletion": "🗑️",
+    "irreversible": "⚠️",
+}
+
+_CTX_PREFIX = "Updated page context after "
+_CTX_ELIDED = "(older page context elided)"
+
+_HEADER_RE = re.compile(r"^[ \t]*([A-Z0-9][A-Z0-9_-]*?)S+:[ \t]*$", re.M)
+_ITEM_RE = re.compile(r"^[ \t]*(?:-|\.\.\.[ \t]*and[ \t]+(\d+)[ \t]+more)", re.M)
+
+
+class _LazyCtxSummary:
+    """Formats a context summary on first str() and reuses it afterwards."""
+
+    __slots__ = ("_format", "_context", "_cached")
+
+    def __init__(self, format_summary: Callable[[Dict], str], context: Dict):
+        self._format = format_summary
+        self._context = context
+        self._cached: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._cached is None:
+            self._cached = self._format(self._context)
+        return self._cached
+
 
 class Coordinator:
     """Main coordinator agent that orchestrates task execution."""
@@ -36,14 +91,42 @@ class Coordinator:
         self.config = config
 
         self.tools = create_coordinator_tools(browser, context_manager, subagents)
+        self._system_prompt = get_coordinator_prompt()
+        self._anthropic_tools = self.tools.get_anthropic_tools(cache_breakpoint=True)
+        tools_list = "\n".join(f"  - {name}" for name in sorted(self.tools.tools))
+        self._retry_hints = (
+            RETRY_HINT_NO_TOOLS,
+            RETRY_HINT_TOOLS_LIST.format(tools_list=tools_list),
+            RETRY_HINT_FINAL,
+        )
+        self._special_result_handlers = {
+            "confirm": self._handle_confirmation_request,
+            "human": self._handle_human_intervention,
+        }
 
         self.conversation: List[MessageParam] = []
+        self._context_msg_indices: Deque[int] = deque()
+        self._last_assistant_idx: Optional[int] = None
+        self._pending_context: Optional[str] = None
+        self._compactor = ConversationCompactor(
+            claude_client, max_messages=config.max_history_messages
+        )
 
         self.task_complete = False
         self.task_summary: Optional[str] = None
 
         self.consecutive_failures = 0
 
+    def close(self) -> None:
+        """Release the Claude client's HTTP connections."""
+        self.claude_client.close()
+
+    def __enter__(self) -> "Coordinator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def execute_task(self, task: str) -> str:
         """Execute a high-level task.
 
@@ -67,9 +150,6 @@ class Coordinator:
             tool_calls = self.claude_client.extract_tool_calls(response)
 
             if not tool_calls:
-                if self.conversation and self.conversation[-1]["role"] == "assistant":
-                    self.conversation.pop()
-
                 no_tool_retry_count = self._handle_no_tool_calls(no_tool_retry_count)
                 if no_tool_retry_count >= MAX_NO_TOOL_RETRIES:
                     break
@@ -83,19 +163,37 @@ class Coordinator:
         return self._finalize_task()
 
     def _initialize_conversation(self, task: str) -> None:
-        """Initialize conversation with task and initial context."""
+        """Initialize conversation with task and initial context.
+
+        The task message never changes during the run and carries the prompt
+        cache breakpoint, so tools + system prompt + task are served from
+        Anthropic's prompt cache on every turn. Page context follows it as a
+        separate message because it is volatile.
+        """
         initial_context = self.context_manager.get_current_context()
+        self._context_msg_indices.clear()
+        self._last_assistant_idx = None
+        self._pending_context = None
         self.conversation = [
             {
                 "role": "user",
-                "content": f"""Task: {task}
-
-Current Page Context:
-{initial_context['overview']}
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"""Task: {task}
 
 Please help me accomplish this task. Start by analyzing what's needed and take appropriate actions.""",
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
             }
         ]
+        self._append_context_message(
+            {
+                "role": "user",
+                "content": f"Current Page Context:\n{initial_context['overview']}",
+            }
+        )
 
     def _get_agent_response(self) -> tuple:
         """Get response from Claude agent.
@@ -103,17 +201,23 @@ Please help me accomplish this task. Start by analyzing what's needed and take a
         Returns:
             Tuple of (response, reasoning)
         """
+        self._flush_pending_context()
+        self._compact_conversation()
+
         response = self.claude_client.send_message(
             messages=self.conversation,
-            system_prompt=get_coordinator_prompt(),
-            tools=self.tools.get_anthropic_tools(),
+            system_prompt=self._system_prompt,
+            tools=self._anthropic_tools,
         )
 
-        self.conversation.append({"role": "assistant", "content": response.content})
+        self._last_assistant_idx = len(self.conversation)
+        self.conversation.append(
+            {"role": "assistant", "content": list(response.content)}
+        )
 
         reasoning = self.claude_client.extract_text(response)
-        if reasoning:
-            logger.info(f"Reasoning: {reasoning}")
+        if reasoning and logger.is_enabled_for(logging.INFO):
+            logger.info("Reasoning: %s", reasoning)
 
         return response, reasoning
 
@@ -126,6 +230,10 @@ Please help me accomplish this task. Start by analyzing what's needed and take a
         Returns:
             Updated retry count
         """
+        if self._last_assistant_idx is not None:
+            del self.conversation[self._last_assistant_idx]
+            self._last_assistant_idx = None
+
         retry_count += 1
         logger.warning(
             f"No tool calls in response. Agent may be stuck. "
@@ -152,6 +260,11 @@ Please help me accomplish this task. Start by analyzing what's needed and take a
         Returns:
             True to continue loop, False to break (task completed)
         """
+        # Calls run one after another on this thread: Playwright's sync API is
+        # bound to the thread that started it, so handlers cannot be farmed out
+        # to a worker pool even when they only read the page.
+        executed_tools = []
+
         for tool_call in tool_calls:
             tool_name = tool_call["name"]
             tool_input = tool_call["input"]
@@ -165,9 +278,9 @@ Please help me accomplish this task. Start by analyzing what's needed and take a
             logger.action("Coordinator", tool_name, tool_input, reasoning)
             result = self.tools.execute_tool(tool_name, **tool_input)
 
+            success = result.kind != "error"
             result = self._handle_special_results(result)
 
-            success = not result.startswith("Error") and not result.startswith("Failed")
             logger.result(result, success)
 
             tool_result_msg = self.claude_client.create_tool_result_message(
@@ -176,11 +289,13 @@ Please help me accomplish this task. Start by analyzing what's needed and take a
             self.conversation.append(tool_result_msg)
 
             self._track_failures(success)
-            self._update_context_if_needed(tool_name, result)
+            executed_tools.append(tool_name)
+
+        self._update_context_if_needed(executed_tools)
 
         return True
 
-    def _handle_special_results(self, result: str) -> str:
+    def _handle_special_results(self, result: ToolResult) -> str:
         """Handle special result types (confirmations, human intervention).
 
         Args:
@@ -189,19 +304,15 @@ Please help me accomplish this task. Start by analyzing what's needed and take a
         Returns:
             Processed result string
         """
-        if result.startswith(CONFIRMATION_REQUIRED):
-            return self._handle_confirmation_request(result)
-
-        if result.startswith(HUMAN_INTERVENTION_REQUIRED):
-            return self._handle_human_intervention(result)
-
-        return result
+        handler = self._special_result_handlers.get(result.kind)
+        if handler is None:
+            return result.payload
+        return handler(result)
 
-    def _handle_confirmation_request(self, result: str) -> str:
+    def _handle_confirmation_request(self, result: ToolResult) -> str:
         """Handle confirmation requests for destructive actions."""
-        parts = result.split(":", 2)
-        risk_level = parts[1] if len(parts) > 1 else "unknown"
-        action_description = parts[2] if len(parts) > 2 else "Unknown action"
+        risk_level = result.risk_level or "unknown"
+        action_description = result.payload or "Unknown action"
 
         confirmed = self._request_user_confirmation(action_description, risk_level)
         if confirmed:
@@ -210,14 +321,18 @@ Please help me accomplish this task. Start by analyzing what's needed and take a
             logger.warning(f"User declined destructive action: {action_description}")
             return "User DECLINED the action. Do NOT proceed. The task cannot be completed as requested."
 
-    def _handle_human_intervention(self, result: str) -> str:
+    def _handle_human_intervention(self, result: ToolResult) -> str:
         """Handle human intervention requests."""
-        description = result.replace(HUMAN_INTERVENTION_REQUIRED, "").strip()
+        description = result.payload.strip()
         self._request_human_intervention(description)
+        self.context_manager.invalidate()
 
         try:
             updated_context = self.context_manager.get_current_context()
-            logger.info(f"Context updated: {self._format_context_summary(updated_context)}")
+            logger.info(
+                "Context updated: %s",
+                _LazyCtxSummary(self._format_context_summary, updated_context),
+            )
 
             return f"""Human intervention completed. User has manually handled the required action in the browser.
 
@@ -235,9 +350,12 @@ You can now continue with the task."""
             self.consecutive_failures = 0
         else:
             self.consecutive_failures += 1
-            logger.info(
-                f"Consecutive failures: {self.consecutive_failures}/{MAX_CONSECUTIVE_FAILURES}"
-            )
+            if logger.is_enabled_for(logging.INFO):
+                logger.info(
+                    "Consecutive failures: %d/%d",
+                    self.consecutive_failures,
+                    MAX_CONSECUTIVE_FAILURES,
+                )
 
             if self.consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
                 logger.warning(
@@ -259,25 +377,65 @@ What would you like to do?""",
         self.conversation.append(help_hint)
         self.consecutive_failures = 0
 
-    def _update_context_if_needed(self, tool_name: str, result: str) -> None:
-        """Update page context if the action might have changed the page."""
-        page_changing_tools = {"click", "navigate_to", "scroll", "type_text", "press_key"}
+    def _update_context_if_needed(self, tool_names: List[str]) -> None:
+        """Schedule a page context update if any of the actions might have changed the page.
+
+        The context itself is fetched lazily by _flush_pending_context right
+        before the next request to Claude, so a run that stops after this turn
+        (max iterations, too many failures) never pays for the extraction.
 
-        if tool_name not in page_changing_tools:
+        Args:
+            tool_names: Names of the tools executed in this turn, in order
+        """
+        changed_by = [name for name in tool_names if name in _PAGE_CHANGING_TOOLS]
+        if not changed_by:
+            return
+
+        self._pending_context = changed_by[0] if len(changed_by) == 1 else "multiple actions"
+
+    def _flush_pending_context(self) -> None:
+        """Fetch and append the page context scheduled by the previous turn."""
+        label = self._pending_context
+        if label is None:
             return
+        self._pending_context = None
 
+        # Fetched on this thread rather than in a background future: Playwright's
+        # sync API cannot be called from a thread other than the one that
+        # started it.
         try:
             updated_context = self.context_manager.get_current_context()
             context_msg = {
                 "role": "user",
-                "content": f"""Updated page context after {tool_name}:
-{updated_context['overview']}""",
+                "content": "".join((_CTX_PREFIX, label, ":\n", updated_context['overview'])),
             }
-            self.conversation.append(context_msg)
-            logger.info(f"Context updated: {self._format_context_summary(updated_context)}")
+            self._append_context_message(context_msg)
+            logger.info(
+                "Context updated: %s",
+                _LazyCtxSummary(self._format_context_summary, updated_context),
+            )
         except Exception as e:
             logger.error(f"Failed to get updated context: {str(e)}")
 
+    def _compact_conversation(self) -> None:
+        """Summarize old history once the conversation grows too long."""
+        removed = self._compactor.compact(self.conversation)
+        if not removed:
+            return
+
+        first_kept = self._compactor.prefix_len + removed + 1
+        self._context_msg_indices = deque(
+            index - removed for index in self._context_msg_indices if index >= first_kept
+        )
+
+    def _append_context_message(self, context_msg: MessageParam) -> None:
+        """Append a page context message, eliding the oldest beyond the window."""
+        self._context_msg_indices.append(len(self.conversation))
+        self.conversation.append(context_msg)
+
+        if len(self._context_msg_indices) > MAX_CONTEXT_MESSAGES:
+            oldest = self._context_msg_indices.popleft()
+            self.conversation[oldest] = {"role": "user", "content": _CTX_ELIDED}
 
     def _finalize_task(self) -> str:
         """Finalize task execution and return summary."""
@@ -296,120 +454,105 @@ What would you like to do?""",
         url = url[:47] + "..." if len(url) > 50 else url
         title = title[:27] + "..." if len(title) > 30 else title
 
-        overview = context.get('overview', '')
-        element_counts = self._count_elements(overview)
+        element_counts = self._count_elements(context.get('overview', ''))
 
         if element_counts:
             counts_str = ', '.join(
                 f"{count} {typ.lower()}{'s' if count != 1 else ''}"
-                for typ, count in element_counts.items() if count > 0
+                for typ, count in element_counts
             )
             return f"{url} | {counts_str}"
 
         return f"{url} | {title}"
 
-    def _count_elements(self, overview: str) -> Dict[str, int]:
-        """Count elements by type from overview text."""
-        element_counts = {}
-        current_type = None
-
-        for line in overview.split('\n'):
-            if line.strip().endswith('S:') and line.strip().isupper():
-                current_type = line.strip().rstrip('S:')
-                element_counts[current_type] = 0
-            elif current_type:
-                if '... and' in line and 'more' in line:
-                    try:
-                        extra = int(line.split('... and')[1].split('more')[0].strip())
-                        element_counts[current_type] += extra
-                    except:
-                        pass
-                elif line.strip().startswith('-'):
-                    element_counts[current_type] = element_counts.get(current_type, 0) + 1
+    def _count_elements(self, overview: str) -> List[Tuple[str, int]]:
+        """Count elements by type from the page overview.
+
+        Each section runs from one header (e.g. "BUTTONS:") to the next; its
+        bullet items count as one each and "... and N more" adds N.
+
+        Returns:
+            (type, count) pairs in overview order, empty sections omitted
+        """
+        element_counts = []
+        headers = list(_HEADER_RE.finditer(overview))
+
+        for i, header in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(overview)
+            count = sum(
+                int(more) if more else 1
+                for more in _ITEM_RE.findall(overview, header.end(), end)
+            )
+            if count:
+                element_counts.append((header.group(1), count))
 
         return element_counts
 
     def _get_retry_hint_message(self, retry_count: int) -> str:
         """Get hint message for retry attempts when agent provides no tool calls."""
-        if retry_count == 1:
-            return """You didn't provide any tool calls in your last response. To continue with the task, you MUST call one of the available tools.
-
-Please analyze the current situation and choose the next action. What tool should you use to make progress on the task?"""
-
-        elif retry_count == 2:
-            tool_names = [tool.name for tool in self.tools.tools]
-            tools_list = "\n".join(f"  - {name}" for name in tool_names)
-
-            return f"""You still haven't provided any tool calls. You MUST use one of the available tools to continue.
-
-Available tools:
-{tools_list}
-
-Based on the current page context and the task goal, which tool should you call next? Please make a decision and call a tool."""
-
-        else:
-            return """This is the final attempt. You MUST call a tool or use task_complete if the task is done.
-
-If you cannot proceed due to:
-- Missing information: Use get_page_overview or get_element_details to gather more info
-- Uncertainty: Make your best guess based on available context
-- Task completion: Use task_complete with a summary
-
-Please call a tool now."""
+        return self._retry_hints[min(retry_count, len(self._retry_hints)) - 1]
 
     def _request_human_intervention(self, description: str) -> None:
         """Pause execution and request human intervention."""
         logger.warning("Human intervention required")
         logger.info(f"📋 {description}")
         logger.separator()
-        print("\n⏸️  PAUSED - Human Action Required")
-        print(f"➡️  {description}")
-        print("\n👉 Please complete this action in the browser window, then press Enter to continue...")
-        print()
+        sys.stdout.writelines((
+            "\n⏸️  PAUSED - Human Action Required\n",
+            f"➡️  {description}\n",
+            "\n👉 Please complete this action in the browser window, then press Enter to continue...\n",
+            "\n",
+            "Press Enter when ready to continue: ",
+        ))
+        sys.stdout.flush()
 
         try:
-            input("Press Enter when ready to continue: ")
+            sys.stdin.readline()
         except KeyboardInterrupt:
             logger.info("\nTask cancelled by user during intervention.")
             raise
 
         logger.separator()
         logger.info("Resuming agent execution...")
-        print()
+        sys.stdout.write("\n")
 
     def _request_user_confirmation(self, action_description: str, risk_level: str) -> bool:
         """Request user confirmation for a destructive action."""
-        risk_emoji = {
-            "financial": "💰",
-            "deletion": "🗑️",
-            "irreversible": "⚠️",
-        }
-        emoji = risk_emoji.get(risk_level, "⚠️")
+        emoji = _RISK_EMOJI.get(risk_level, "⚠️")
 
         logger.separator()
         logger.warning(f"Destructive action detected ({risk_level})")
         logger.info(f"{emoji} {action_description}")
         logger.separator()
 
-        print(f"\n{emoji}  CONFIRMATION REQUIRED - {risk_level.upper()} ACTION")
-        print(f"➡️  {action_description}")
-        print("\n⚠️  This action may be irreversible!")
-        print()
+        sys.stdout.writelines((
+            f"\n{emoji}  CONFIRMATION REQUIRED - {risk_level.upper()} ACTION\n",
+            f"➡️  {action_description}\n",
+            "\n⚠️  This action may be irreversible!\n",
+            "\n",
+        ))
 
         while True:
+            sys.stdout.write("Do you want to proceed? (yes/no): ")
+            sys.stdout.flush()
             try:
-                response = input("Do you want to proceed? (yes/no): ").strip().lower()
-                if response in ["yes", "y"]:
-                    logger.info("User confirmed action")
-                    print()
-                    return True
-                elif response in ["no", "n"]:
-                    logger.info("User declined action")
-                    print()
-                    return False
-                else:
-                    print("Please enter 'yes' or 'no'")
+                line = sys.stdin.readline()
             except KeyboardInterrupt:
                 logger.info("\nTask cancelled by user.")
-                print()
+                sys.stdout.write("\n")
+                return False
+
+            if not line:
+                logger.info("No input available, treating as declined")
+                return False
+
+            response = line.strip().lower()
+            if response in ("yes", "y"):
+                logger.info("User confirmed action")
+                sys.stdout.write("\n")
+                return True
+            if response in ("no", "n"):
+                logger.info("User declined action")
+                sys.stdout.write("\n")
                 return False
+            sys.stdout.write("Please enter 'yes' or 'no'\n")
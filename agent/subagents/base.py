@@ -1,4 +1,5 @@
-from typing import List, Dict, Any
+import json
+from typing import List, Dict, Any, Optional
 
 from anthropic.types import MessageParam
 
@@ -21,6 +22,7 @@ class SubAgent:
         self.system_prompt = system_prompt
         self.claude_client = claude_client
         self.tools = tools
+        self._anthropic_tools = tools.get_anthropic_tools(cache_breakpoint=True)
         self.conversation: List[MessageParam] = []
 
     def execute(self, subtask: str, max_steps: int = 10) -> str:
@@ -47,7 +49,7 @@ class SubAgent:
             response = self.claude_client.send_message(
                 messages=self.conversation,
                 system_prompt=self.system_prompt,
-                tools=self.tools.get_anthropic_tools(),
+                tools=self._anthropic_tools,
             )
 
             self.conversation.append({"role": "assistant", "content": response.content})
@@ -65,7 +67,7 @@ class SubAgent:
 
                 logger.action(self.name, tool_name, tool_input)
 
-                result = self.tools.execute_tool(tool_name, **tool_input)
+                result = self.tools.execute_tool(tool_name, **tool_input).payload
                 logger.result(result)
 
                 tool_result_msg = self.claude_client.create_tool_result_message(
@@ -75,3 +77,78 @@ class SubAgent:
 
         logger.warning(f"{self.name} reached max steps ({max_steps})")
         return f"Sub-agent {self.name} reached maximum steps without completing the subtask."
+
+    def execute_batch(
+        self, subtasks: List[str], batch_size: int = 8, max_steps: int = 10
+    ) -> List[str]:
+        """
+        Execute several homogeneous subtasks, batch_size of them per run.
+
+        Each batch is sent as one numbered subtask and the sub-agent is asked
+        for a JSON array with one result per item, so a batch costs one
+        tool loop instead of one per item. The run's step budget scales with
+        the batch, so items needing several browser turns still fit.
+
+        Args:
+            subtasks: Subtask descriptions, e.g. the same extraction for many items
+            batch_size: Maximum number of subtasks handled in one run
+            max_steps: Step budget per subtask; a run gets max_steps for each
+                item in its batch
+
+        Returns:
+            One result per subtask, in input order
+        """
+        results: List[str] = []
+
+        for start in range(0, len(subtasks), batch_size):
+            batch = subtasks[start:start + batch_size]
+            items = "\n".join(f"{i}. {subtask}" for i, subtask in enumerate(batch, 1))
+            response = self.execute(
+                f"Complete each of these items:\n{items}\n\n"
+                f"Finish with a JSON array of exactly {len(batch)} strings, "
+                f"one result per item in the same order.",
+                max_steps=max_steps * len(batch),
+            )
+            parsed = self._parse_batch_results(response, len(batch))
+            if parsed is None:
+                logger.warning(f"{self.name} returned no parsable batch result")
+                first = start + 1
+                parsed = [
+                    f"Error: batch result could not be parsed. Full sub-agent response:\n{response}"
+                ] + [
+                    f"Error: batch result could not be parsed, see item {first}"
+                ] * (len(batch) - 1)
+            results.extend(parsed)
+
+        return results
+
+    @staticmethod
+    def _parse_batch_results(response: str, expected: int) -> Optional[List[str]]:
+        """Parse a batch response into per-item results.
+
+        Takes the JSON array that ends at the last "]" of the response, so
+        bracketed text earlier in the prose does not get in the way.
+
+        Returns:
+            One string per item, or None if there is no such array or it has
+            the wrong length
+        """
+        end = response.rfind("]")
+        if end == -1:
+            return None
+
+        decoder = json.JSONDecoder()
+        start = response.rfind("[", 0, end + 1)
+        while start != -1:
+            try:
+                parsed, stop = decoder.raw_decode(response, start)
+            except json.JSONDecodeError:
+                pass
+            else:
+                if stop == end + 1 and isinstance(parsed, list):
+                    if len(parsed) != expected:
+                        return None
+                    return [item if isinstance(item, str) else json.dumps(item) for item in parsed]
+            start = response.rfind("[", 0, start)
+
+        return None
@@ -1,7 +1,14 @@
 from agent.subagents.base import SubAgent
 from llm.claude_client import ClaudeClient
 from llm.prompts import get_subagent_prompt
-from agent.tools import ToolRegistry, Tool
+from agent.tools import (
+    Tool,
+    ToolRegistry,
+    create_scroll_tool,
+    create_wait_tool,
+    create_page_overview_tool,
+    create_element_details_tool,
+)
 
 
 class DataReader(SubAgent):
@@ -19,13 +26,6 @@ class DataReader(SubAgent):
 
     def _create_tools(self, browser, context_manager) -> ToolRegistry:
         """Create tools specific to data reading."""
-        from agent.tools import (
-            create_scroll_tool,
-            create_wait_tool,
-            create_page_overview_tool,
-            create_element_details_tool,
-        )
-
         registry = ToolRegistry()
 
         registry.register(create_page_overview_tool(context_manager))
@@ -1,7 +1,17 @@
+from functools import partial
+
 from agent.subagents.base import SubAgent
 from llm.claude_client import ClaudeClient
 from llm.prompts import get_subagent_prompt
-from agent.tools import ToolRegistry, Tool
+from agent.tools import (
+    Tool,
+    ToolRegistry,
+    create_type_text_tool,
+    create_click_tool,
+    create_wait_tool,
+    create_page_overview_tool,
+    create_element_details_tool,
+)
 
 
 class FormFiller(SubAgent):
@@ -19,14 +29,6 @@ class FormFiller(SubAgent):
 
     def _create_tools(self, browser, context_manager) -> ToolRegistry:
         """Create tools specific to form filling."""
-        from agent.tools import (
-            create_type_text_tool,
-            create_click_tool,
-            create_wait_tool,
-            create_page_overview_tool,
-            create_element_details_tool,
-        )
-
         registry = ToolRegistry()
 
         registry.register(create_type_text_tool(browser))
@@ -47,10 +49,11 @@ class FormFiller(SubAgent):
                 parameters={
                     "key": {
                         "type": "string",
+                        "required": True,
                         "description": "Key to press. Options: 'Enter' (submit form), 'Tab' (next field)",
                     }
                 },
-                handler=lambda key: self._press_key_handler(browser, key),
+                handler=partial(self._press_key_handler, browser),
             )
         )
 
@@ -1,7 +1,19 @@
+from functools import partial
+
 from agent.subagents.base import SubAgent
 from llm.claude_client import ClaudeClient
 from llm.prompts import get_subagent_prompt
-from agent.tools import ToolRegistry, Tool
+from agent.tools import (
+    Tool,
+    ToolRegistry,
+    create_navigation_tool,
+    create_click_tool,
+    create_hover_tool,
+    create_scroll_tool,
+    create_wait_tool,
+    create_page_overview_tool,
+    create_element_details_tool,
+)
 
 
 class Navigator(SubAgent):
@@ -19,16 +31,6 @@ class Navigator(SubAgent):
 
     def _create_tools(self, browser, context_manager) -> ToolRegistry:
         """Create tools specific to navigation."""
-        from agent.tools import (
-            create_navigation_tool,
-            create_click_tool,
-            create_hover_tool,
-            create_scroll_tool,
-            create_wait_tool,
-            create_page_overview_tool,
-            create_element_details_tool,
-        )
-
         registry = ToolRegistry()
 
         registry.register(create_navigation_tool(browser))
@@ -56,10 +58,11 @@ class Navigator(SubAgent):
                 parameters={
                     "key": {
                         "type": "string",
+                        "required": True,
                         "description": "Key to press. Only 'Escape' is supported for Navigator.",
                     }
                 },
-                handler=lambda key: self._press_key_handler(browser, key),
+                handler=partial(self._press_key_handler, browser),
             )
         )
 
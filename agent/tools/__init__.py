@@ -1,6 +1,6 @@
 """Agent tools - modular structure for tool definitions."""
 
-from agent.tools.registry import Tool, ToolRegistry
+from agent.tools.registry import Tool, ToolRegistry, ToolResult
 from agent.tools.factories import (
     create_coordinator_tools,
     create_navigation_tool,
@@ -16,6 +16,7 @@ from agent.tools.factories import (
 __all__ = [
     "Tool",
     "ToolRegistry",
+    "ToolResult",
     "create_coordinator_tools",
     "create_navigation_tool",
     "create_click_tool",
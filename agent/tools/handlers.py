@@ -1,6 +1,44 @@
+import re
+from functools import lru_cache
+from itertools import islice
+from typing import List
+
+
+_BROAD_SELECTORS = frozenset(("body", "html", "*"))
+
+# Characters the comma check reacts to; a quote preceded by a backslash is
+# matched as a pair and ignored.
+_SELECTOR_TOKEN_RE = re.compile(r"""\\["']|["'\[\](),]""")
+
+
+def _has_top_level_comma(selector: str) -> bool:
+    """Check for a comma outside quotes, brackets and parentheses."""
+    quote_char = None
+    in_brackets = 0
+
+    for token in _SELECTOR_TOKEN_RE.findall(selector):
+        if token in ('"', "'"):
+            if quote_char is None:
+                quote_char = token
+            elif token == quote_char:
+                quote_char = None
+        elif token in ('[', '('):
+            in_brackets += 1
+        elif token in (']', ')'):
+            in_brackets -= 1
+        elif token == ',' and quote_char is None and in_brackets == 0:
+            return True
+
+    return False
+
+
+@lru_cache(maxsize=1024)
 def validate_selector(selector: str, tool_name: str) -> str:
     """Validate selector format and return error if invalid.
 
+    Results are memoized per (selector, tool_name); agents tend to reuse the
+    same handful of selectors during a task.
+
     Args:
         selector: The selector to validate
         tool_name: Name of the tool for error messages
@@ -8,30 +46,16 @@ def validate_selector(selector: str, tool_name: str) -> str:
     Returns:
         Error message if invalid, empty string if valid
     """
-    if not selector or not selector.strip():
+    stripped = selector.strip() if selector else ""
+    if not stripped:
         return f"Error: Empty selector provided to {tool_name}. Please provide a valid CSS selector."
 
-    in_quotes = False
-    in_brackets = 0
-    quote_char = None
+    # Most selectors contain no comma at all; only those need the
+    # quote/bracket-aware scan.
+    if "," in selector and _has_top_level_comma(selector):
+        return f"Error: Invalid selector '{selector}' for {tool_name}. Contains comma-separated selectors. Use a single specific selector instead. Examples: 'button.submit', 'div.container >> a', 'input[name=\"email\"]'."
 
-    for i, char in enumerate(selector):
-        if char in ('"', "'") and (i == 0 or selector[i-1] != '\\'):
-            if not in_quotes:
-                in_quotes = True
-                quote_char = char
-            elif char == quote_char:
-                in_quotes = False
-                quote_char = None
-        elif char in ('[', '('):
-            in_brackets += 1
-        elif char in (']', ')'):
-            in_brackets -= 1
-        elif char == ',' and not in_quotes and in_brackets == 0:
-            return f"Error: Invalid selector '{selector}' for {tool_name}. Contains comma-separated selectors. Use a single specific selector instead. Examples: 'button.submit', 'div.container >> a', 'input[name=\"email\"]'."
-
-    stripped = selector.strip()
-    if stripped in ('body', 'html', '*'):
+    if stripped in _BROAD_SELECTORS:
         return f"Error: Invalid selector '{selector}' for {tool_name}. Selector is too broad. Use a more specific selector like '.container', '#main-content', 'nav.header'."
 
     return ""
@@ -85,7 +109,7 @@ def type_text_handler(browser, selector: str, text: str) -> str:
         return f"Failed to type text: {str(e)}"
 
 
-def scroll_handler(browser, direction: str, amount: int) -> str:
+def scroll_handler(browser, direction: str, amount: int = 500) -> str:
     """Handle scrolling."""
     try:
         browser.scroll(direction, amount)
@@ -103,7 +127,7 @@ def press_key_handler(browser, key: str) -> str:
         return f"Failed to press key: {str(e)}"
 
 
-def wait_for_element_handler(browser, selector: str, timeout: int) -> str:
+def wait_for_element_handler(browser, selector: str, timeout: int = 10000) -> str:
     """Handle waiting for an element."""
     error = validate_selector(selector, "wait_for_element")
     if error:
@@ -136,23 +160,24 @@ def find_element_by_text_handler(context_manager, text: str, role: str = None) -
     results = context_manager.find_elements_by_text(text, role)
 
     if not results:
-        return f"No elements found containing text '{text}'" + (f" with role '{role}'" if role else "")
+        role_suffix = f" with role '{role}'" if role else ""
+        return f"No elements found containing text '{text}'{role_suffix}"
 
     if len(results) == 1:
         elem = results[0]
         return f"Found 1 element: {elem['tag']} '{elem['text'][:50]}' {elem['context']}\nSelector: {elem['selector']}"
 
-    response_parts = [f"Found {len(results)} elements containing '{text}':"]
-    for i, elem in enumerate(results[:10], 1):
-        response_parts.append(
-            f"{i}. {elem['tag']} '{elem['text'][:50]}' {elem['context']}\n   Selector: {elem['selector']}"
-        )
-
-    if len(results) > 10:
-        response_parts.append(f"... and {len(results) - 10} more matches")
+    total = len(results)
+    body = "\n".join(
+        f"{i}. {elem['tag']} '{elem['text'][:50]}' {elem['context']}\n   Selector: {elem['selector']}"
+        for i, elem in enumerate(islice(results, 10), 1)
+    )
+    more = f"\n... and {total - 10} more matches" if total > 10 else ""
 
-    response_parts.append("\nChoose the appropriate selector from the list above for your next action.")
-    return "\n".join(response_parts)
+    return (
+        f"Found {total} elements containing '{text}':\n{body}{more}\n"
+        "\nChoose the appropriate selector from the list above for your next action."
+    )
 
 
 def delegate_handler(subagents, subagent: str, subtask: str) -> str:
@@ -165,6 +190,22 @@ def delegate_handler(subagents, subagent: str, subtask: str) -> str:
     return result
 
 
+def delegate_batch_handler(subagents, subagent: str, subtasks: List[str]) -> str:
+    """Handle delegation of several homogeneous subtasks to a sub-agent."""
+    if subagent not in subagents:
+        return f"Unknown sub-agent: {subagent}"
+    if not isinstance(subtasks, list):
+        return "Error: subtasks must be a list of strings"
+    if not subtasks:
+        return "No subtasks provided"
+
+    results = subagents[subagent].execute_batch(subtasks)
+    return "\n".join(
+        f"{i}. {subtask}\n   → {result}"
+        for i, (subtask, result) in enumerate(zip(subtasks, results), 1)
+    )
+
+
 def list_tabs_handler(browser) -> str:
     """Handle listing all open tabs."""
     try:
@@ -186,9 +227,7 @@ def list_tabs_handler(browser) -> str:
 def switch_to_tab_handler(browser, tab_index: int) -> str:
     """Handle switching to a different tab."""
     try:
-        browser.switch_to_tab(tab_index)
-        tabs = browser.list_tabs()
-        active_tab = tabs[tab_index]
+        active_tab = browser.switch_to_tab(tab_index)
         return f"Switched to tab {tab_index}: {active_tab['title'][:50]} - {active_tab['url'][:60]}"
     except Exception as e:
         return f"Failed to switch to tab: {str(e)}"
@@ -197,13 +236,8 @@ def switch_to_tab_handler(browser, tab_index: int) -> str:
 def close_tab_handler(browser, tab_index: int) -> str:
     """Handle closing a tab."""
     try:
-        tabs = browser.list_tabs()
-        if tab_index < len(tabs):
-            tab_info = tabs[tab_index]
-            browser.close_tab(tab_index)
-            return f"Closed tab {tab_index}: {tab_info['title'][:50]}"
-        else:
-            return f"Invalid tab index: {tab_index}"
+        tab_info = browser.close_tab(tab_index)
+        return f"Closed tab {tab_index}: {tab_info['title'][:50]}"
     except Exception as e:
         return f"Failed to close tab: {str(e)}"
 
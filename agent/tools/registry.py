@@ -1,69 +1,148 @@
 """Tool registry - base classes for agent tools."""
 
-from typing import Any, Callable, Dict, List
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 from anthropic.types import ToolParam
 
+FAILURE_PREFIXES = ("Error", "Failed")
+
+# Shared by every tool without parameters; never modified.
+_EMPTY_INPUT_SCHEMA = {"type": "object", "properties": {}, "required": []}
+
+
+@dataclass(frozen=True, slots=True)
+class ToolResult:
+    """Outcome of a tool call.
+
+    kind is "ok" for regular results, "error" when the tool failed, "confirm"
+    when the user must approve a destructive action, and "human" when manual
+    intervention is needed.
+    """
+
+    kind: Literal["ok", "error", "confirm", "human"]
+    payload: str
+    risk_level: Optional[str] = None
+
+    def __str__(self) -> str:
+        return self.payload
+
 
 class Tool:
     """Represents a tool that the agent can use."""
 
+    __slots__ = ("name", "description", "parameters", "handler", "_anthropic")
+
     def __init__(
         self,
         name: str,
         description: str,
         parameters: Dict[str, Any],
-        handler: Callable,
+        handler: Callable[..., Union[str, ToolResult]],
     ):
         self.name = name
         self.description = description
         self.parameters = parameters
         self.handler = handler
-
-    def to_anthropic_tool(self) -> ToolParam:
-        """Convert to Anthropic tool format."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input_schema": {
+        if parameters:
+            # "required": True on a parameter is our own marker; JSON Schema
+            # wants it as a list on the object, so strip it from properties.
+            required = [k for k, v in parameters.items() if v.get("required", False)]
+            properties = {
+                k: {f: x for f, x in v.items() if f != "required"} if "required" in v else v
+                for k, v in parameters.items()
+            }
+            input_schema = {
                 "type": "object",
-                "properties": self.parameters,
-                "required": [
-                    k for k, v in self.parameters.items() if v.get("required", False)
-                ],
-            },
+                "properties": properties,
+                "required": required,
+            }
+        else:
+            input_schema = _EMPTY_INPUT_SCHEMA
+        self._anthropic: ToolParam = {
+            "name": name,
+            "description": description,
+            "input_schema": input_schema,
         }
 
+    def to_anthropic_tool(self) -> ToolParam:
+        """Convert to Anthropic tool format.
+
+        The schema is built once in __init__; tools are not modified after
+        construction.
+        """
+        return self._anthropic
+
 
 class ToolRegistry:
     """Registry of available tools for the agent."""
 
+    __slots__ = ("tools", "_handlers", "_all_tools", "_anthropic_tools")
+
     def __init__(self):
         self.tools: Dict[str, Tool] = {}
+        self._handlers: Dict[str, Callable] = {}
+        self._all_tools: Tuple[Tool, ...] = ()
+        self._anthropic_tools: Optional[Tuple[List[ToolParam], List[ToolParam]]] = None
 
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self.tools[tool.name] = tool
+        self._handlers[tool.name] = tool.handler
+        self._all_tools = tuple(self.tools.values())
+        self._anthropic_tools = None
 
     def get_tool(self, name: str) -> Tool:
         """Get a tool by name."""
-        if name not in self.tools:
-            raise ValueError(f"Unknown tool: {name}")
-        return self.tools[name]
+        try:
+            return self.tools[name]
+        except KeyError:
+            raise ValueError(f"Unknown tool: {name}") from None
 
-    def get_all_tools(self) -> List[Tool]:
-        """Get all registered tools."""
-        return list(self.tools.values())
+    def get_all_tools(self) -> Tuple[Tool, ...]:
+        """Get all registered tools (rebuilt on register, not per call)."""
+        return self._all_tools
 
-    def get_anthropic_tools(self) -> List[ToolParam]:
-        """Get all tools in Anthropic format."""
-        return [tool.to_anthropic_tool() for tool in self.tools.values()]
+    def get_anthropic_tools(self, cache_breakpoint: bool = False) -> List[ToolParam]:
+        """Get all tools in Anthropic format, ordered by name for a stable payload.
 
-    def execute_tool(self, name: str, **kwargs) -> str:
-        """Execute a tool with given arguments."""
-        tool = self.get_tool(name)
+        The list is cached until the next register() call.
+
+        Args:
+            cache_breakpoint: Mark the last tool with cache_control so the
+                whole tool block is served from Anthropic's prompt cache
+        """
+        if self._anthropic_tools is None:
+            tools = [
+                tool.to_anthropic_tool()
+                for tool in sorted(self.tools.values(), key=lambda tool: tool.name)
+            ]
+            cached = list(tools)
+            if cached:
+                cached[-1] = {**cached[-1], "cache_control": {"type": "ephemeral"}}
+            self._anthropic_tools = (tools, cached)
+        tools, cached = self._anthropic_tools
+        return cached if cache_breakpoint else tools
+
+    def execute_tool(self, name: str, **kwargs) -> ToolResult:
+        """Execute a tool with given arguments.
+
+        Handlers may return a ToolResult or a plain string; strings starting
+        with "Error" or "Failed" are classified as errors. Unknown tool names
+        and handler exceptions are reported as error results, not raised.
+        """
+        handler = self._handlers.get(name)
+        if handler is None:
+            return ToolResult("error", f"Error: Unknown tool: {name}")
         try:
-            result = tool.handler(**kwargs)
-            return str(result)
+            result = handler(**kwargs)
         except Exception as e:
-            return f"Error executing tool {name}: {str(e)}"
+            return ToolResult("error", f"Error executing tool {name}: {str(e)}")
+
+        if type(result) is not str:
+            if isinstance(result, ToolResult):
+                return result
+            result = str(result)
+
+        kind = "error" if result.startswith(FAILURE_PREFIXES) else "ok"
+        return ToolResult(kind, result)
@@ -1,4 +1,5 @@
-from typing import List, Dict, Tuple
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 
 from playwright.sync_api import Page
 
@@ -31,9 +32,11 @@ class BrowserController:
         self.tab_manager = TabManager(self.lifecycle)
         self.frame_manager = FrameManager(self.lifecycle, self.interactor)
 
+        self._state_version = 0
+
 
     def start(self) -> Page:
-        """Start the browser with persistent context (saves cookies/sessions).
+        """Start a browser context (restores cookies/sessions).
 
         Returns:
             The active browser page
@@ -42,8 +45,17 @@ class BrowserController:
 
     def stop(self) -> None:
         """Stop the browser and clean up resources (saves session state)."""
+        self._state_version += 1
         self.lifecycle.stop()
 
+    def save_storage_state(self, path: Path) -> None:
+        """Save cookies and local storage of the current context to a file.
+
+        Args:
+            path: JSON file to write
+        """
+        self.lifecycle.save_storage_state(path)
+
     @property
     def page(self) -> Page:
         """Get the current page.
@@ -56,6 +68,15 @@ class BrowserController:
         """
         return self.lifecycle.page
 
+    @property
+    def state_version(self) -> int:
+        """Get a counter that changes whenever an action may have changed the page.
+
+        Returns:
+            Monotonic version number, bumped by every navigation or interaction
+        """
+        return self._state_version
+
 
     def navigate_to(self, url: str, timeout: int = 30000) -> None:
         """Navigate to a URL with protocol validation.
@@ -67,6 +88,7 @@ class BrowserController:
         Raises:
             Exception: If URL has unsafe protocol or navigation fails
         """
+        self._state_version += 1
         self.navigator.navigate_to(url, timeout)
 
     def get_current_url(self) -> str:
@@ -108,6 +130,7 @@ class BrowserController:
         Raises:
             Exception: If selector is invalid or all click attempts fail
         """
+        self._state_version += 1
         self.interactor.click(selector, timeout)
 
     def type_text(self, selector: str, text: str, timeout: int = 10000) -> None:
@@ -121,6 +144,7 @@ class BrowserController:
         Raises:
             Exception: If selector is invalid or typing fails
         """
+        self._state_version += 1
         self.interactor.type_text(selector, text, timeout)
 
     def scroll(self, direction: str = "down", amount: int = 500) -> None:
@@ -133,6 +157,7 @@ class BrowserController:
         Raises:
             Exception: If scroll fails
         """
+        self._state_version += 1
         self.interactor.scroll(direction, amount)
 
     def wait_for_selector(
@@ -151,6 +176,8 @@ class BrowserController:
         Raises:
             Exception: If selector is invalid
         """
+        # Waiting lets the page change underneath us.
+        self._state_version += 1
         return self.interactor.wait_for_selector(selector, timeout, state)
 
     def press_key(self, key: str) -> None:
@@ -162,6 +189,7 @@ class BrowserController:
         Raises:
             Exception: If key is invalid or press fails
         """
+        self._state_version += 1
         self.interactor.press_key(key)
 
     def hover(self, selector: str, timeout: int = 10000) -> None:
@@ -174,15 +202,20 @@ class BrowserController:
         Raises:
             Exception: If selector is invalid or hover fails
         """
+        self._state_version += 1
         self.interactor.hover(selector, timeout)
 
-    def take_screenshot(self, path: str) -> None:
+    def take_screenshot(
+        self, path: str, full_page: bool = False, quality: Optional[int] = None
+    ) -> None:
         """Take a screenshot of the current page.
 
         Args:
-            path: File path to save screenshot
+            path: File path to save screenshot; .jpg/.jpeg paths are saved as JPEG
+            full_page: Capture the whole scrollable page instead of the viewport
+            quality: JPEG quality 0-100 (default 80), ignored for PNG
         """
-        self.interactor.take_screenshot(path)
+        self.interactor.take_screenshot(path, full_page, quality)
 
 
     def list_tabs(self) -> List[Dict]:
@@ -193,27 +226,35 @@ class BrowserController:
         """
         return self.tab_manager.list_tabs()
 
-    def switch_to_tab(self, tab_index: int) -> None:
+    def switch_to_tab(self, tab_index: int) -> Dict:
         """Switch to a different tab by index.
 
         Args:
             tab_index: Zero-based index of the tab to switch to
 
+        Returns:
+            Dict with index, title, url of the now active tab
+
         Raises:
             Exception: If tab index is invalid
         """
-        self.tab_manager.switch_to_tab(tab_index)
+        self._state_version += 1
+        return self.tab_manager.switch_to_tab(tab_index)
 
-    def close_tab(self, tab_index: int) -> None:
+    def close_tab(self, tab_index: int) -> Dict:
         """Close a tab by index.
 
         Args:
             tab_index: Zero-based index of the tab to close
 
+        Returns:
+            Dict with index, title, url of the closed tab
+
         Raises:
             Exception: If tab index is invalid or trying to close the only tab
         """
-        self.tab_manager.close_tab(tab_index)
+        self._state_version += 1
+        return self.tab_manager.close_tab(tab_index)
 
     def get_active_tab_index(self) -> int:
         """Get the index of the currently active tab.
@@ -233,8 +274,10 @@ class BrowserController:
         Raises:
             Exception: If selector is invalid or iframe not found
         """
+        self._state_version += 1
         self.frame_manager.switch_to_frame(selector)
 
     def switch_to_main_content(self) -> None:
         """Switch context back to the main page content (exit iframe context)."""
+        self._state_version += 1
         self.frame_manager.switch_to_main_content()
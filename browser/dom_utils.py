@@ -1,7 +1,42 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from playwright.sync_api import Page
 
+# Returns [title, document time origin, DOM mutation count, form values hash].
+# The observer is installed once per document; the find-id attributes written
+# by find_elements_by_text are not counted as page changes.
+_PAGE_SIGNATURE_JS = """
+() => {
+    let state = window.__autobrowserDomState;
+    if (!state) {
+        state = window.__autobrowserDomState = { mutations: 0 };
+        new MutationObserver(records => {
+            for (const record of records) {
+                if (record.attributeName !== 'data-autobrowser-find-id') state.mutations++;
+            }
+        }).observe(document, {
+            subtree: true,
+            childList: true,
+            attributes: true,
+            characterData: true
+        });
+    }
+
+    let valuesHash = 0;
+    for (const el of document.querySelectorAll('input, textarea, select')) {
+        const value = (el.type === 'checkbox' || el.type === 'radio')
+            ? String(el.checked)
+            : String(el.value);
+        for (let i = 0; i < value.length; i++) {
+            valuesHash = (valuesHash * 31 + value.charCodeAt(i)) | 0;
+        }
+        valuesHash = (valuesHash * 31 + 1) | 0;
+    }
+
+    return [document.title, performance.timeOrigin, state.mutations, valuesHash];
+}
+"""
+
 
 class DOMExtractor:
     """Extracts and simplifies DOM information for the agent."""
@@ -65,13 +100,40 @@ class DOMExtractor:
         for child in node.get("children", []):
             self._extract_accessible_elements(child, elements, depth + 1)
 
+    def get_page_signature(self) -> Tuple[str, str, float, int, int]:
+        """
+        Get a cheap fingerprint of the current page state.
+        Used to detect whether a previously extracted overview is still current.
+
+        The first call on a document installs a MutationObserver that counts
+        DOM changes; form control values set by page scripts are not DOM
+        mutations, so they are hashed separately.
+
+        Returns:
+            Tuple of (url, title, document time origin, mutation count, form values hash)
+        """
+        title, time_origin, mutations, values_hash = self.page.evaluate(_PAGE_SIGNATURE_JS)
+        return self.page.url, title, time_origin, mutations, values_hash
+
     def get_page_overview(self) -> str:
         """
         Get a concise overview of the page with CSS selectors.
         This is the primary context sent to the agent.
         """
-        url = self.page.url
-        title = self.page.title()
+        return self.get_page_overview_with_signature()[0]
+
+    def get_page_overview_with_signature(self) -> Tuple[str, Tuple[str, str, float, int, int]]:
+        """
+        Get the page overview together with the page signature taken just before it.
+
+        The signature replaces the separate title lookup, so it costs no extra
+        round-trip.
+
+        Returns:
+            Tuple of (overview, signature as returned by get_page_signature)
+        """
+        signature = self.get_page_signature()
+        url, title = signature[:2]
 
         elements_with_selectors = self._get_interactive_elements_with_attributes()
 
@@ -112,7 +174,7 @@ class DOMExtractor:
             if len(elements) > 10:
                 overview_parts.append(f"  ... and {len(elements) - 10} more")
 
-        return "\n".join(overview_parts)
+        return "\n".join(overview_parts), signature
 
     def _get_interactive_elements_with_attributes(self) -> List[Dict[str, Any]]:
         """
@@ -1,9 +1,52 @@
-from typing import Tuple
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 
 from browser.lifecycle import BrowserLifecycle
 
+# Escaped quotes, quoted strings (an unterminated quote runs to the end) and
+# the structural characters the comma check cares about. A quote preceded by
+# a backslash never opens or closes a string.
+_SELECTOR_TOKEN_RE = re.compile(
+    r"""\\["']|"(?:[^"\\]|\\"?)*(?:"|\Z)|'(?:[^'\\]|\\'?)*(?:'|\Z)|[\[\],]"""
+)
+
+# One function source for every pixel scroll, so the renderer compiles it
+# once; direction and amount are passed as arguments.
+_SCROLL_JS = """([direction, amount]) => {
+    if (direction === "down") window.scrollBy(0, amount);
+    else if (direction === "up") window.scrollBy(0, -amount);
+    else if (direction === "bottom") window.scrollTo(0, document.body.scrollHeight);
+    else if (direction === "top") window.scrollTo(0, 0);
+}"""
+_SCROLL_JS_DIRECTIONS = frozenset(("down", "up", "bottom", "top"))
+_SCROLL_KEYS = {"page_down": "PageDown", "page_up": "PageUp"}
+
+_SUPPORTED_KEYS = frozenset((
+    "Enter",
+    "Escape",
+    "Tab",
+    "Space",
+    "ArrowUp",
+    "ArrowDown",
+    "ArrowLeft",
+    "ArrowRight",
+    "Backspace",
+    "Delete",
+    "Home",
+    "End",
+    "PageUp",
+    "PageDown",
+))
+_SUPPORTED_KEYS_MSG = ", ".join(sorted(_SUPPORTED_KEYS))
+
+# Timeout in milliseconds for the force and JavaScript click fallbacks.
+_FALLBACK_CLICK_TIMEOUT = 1000
+
+_DEFAULT_JPEG_QUALITY = 80
+
 
 class BrowserInteractor:
     """Handles browser interactions with elements."""
@@ -12,9 +55,13 @@ class BrowserInteractor:
         self.lifecycle = lifecycle
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def validate_selector(selector: str) -> Tuple[bool, str]:
         """Validate a Playwright selector before use.
 
+        Results are memoized; the same selector is usually validated several
+        times in a row (wait, click, type).
+
         Args:
             selector: The selector string to validate
 
@@ -35,7 +82,7 @@ class BrowserInteractor:
         if ",," in selector:
             return False, "Selector contains double comma - invalid syntax"
 
-        if selector.count(">>") > 0 and selector.count(",") > 0:
+        if ">>" in selector and "," in selector:
             return False, "Selector mixes >> and comma syntax - use one style consistently"
 
         return True, ""
@@ -44,71 +91,29 @@ class BrowserInteractor:
     def _check_invalid_commas(selector: str) -> str:
         """Check if selector has invalid commas (outside quotes/brackets).
 
+        Quoted strings and escapes are skipped by the regex, so the loop only
+        sees brackets and commas.
+
         Args:
             selector: Selector to check
 
         Returns:
             Error message if invalid comma found, empty string otherwise
         """
-        in_quotes = False
+        if "," not in selector:
+            return ""
+
         in_brackets = 0
-        quote_char = None
-
-        for i, char in enumerate(selector):
-            if BrowserInteractor._is_quote_char(char, i, selector, in_quotes, quote_char):
-                in_quotes, quote_char = BrowserInteractor._toggle_quotes(
-                    char, in_quotes, quote_char
-                )
-            elif char == "[" and not in_quotes:
+        for token in _SELECTOR_TOKEN_RE.findall(selector):
+            if token == "[":
                 in_brackets += 1
-            elif char == "]" and not in_quotes:
+            elif token == "]":
                 in_brackets = max(0, in_brackets - 1)
-            elif char == "," and not in_quotes and in_brackets == 0:
+            elif token == "," and in_brackets == 0:
                 return "Selector contains comma outside quotes/brackets - use a single specific selector instead of multiple fragments"
 
         return ""
 
-    @staticmethod
-    def _is_quote_char(
-        char: str, index: int, selector: str, in_quotes: bool, quote_char: str
-    ) -> bool:
-        """Check if character is a quote that should toggle quote mode.
-
-        Args:
-            char: Current character
-            index: Character index
-            selector: Full selector string
-            in_quotes: Whether currently in quotes
-            quote_char: Current quote character if in quotes
-
-        Returns:
-            True if this is a quote toggle character
-        """
-        if char not in ('"', "'"):
-            return False
-
-        is_not_escaped = index == 0 or selector[index - 1] != "\\"
-
-        return is_not_escaped and (not in_quotes or char == quote_char)
-
-    @staticmethod
-    def _toggle_quotes(char: str, in_quotes: bool, quote_char: str) -> Tuple[bool, str]:
-        """Toggle quote tracking state.
-
-        Args:
-            char: Quote character
-            in_quotes: Current quote state
-            quote_char: Current quote character
-
-        Returns:
-            Tuple of (new_in_quotes, new_quote_char)
-        """
-        if not in_quotes:
-            return True, char
-        elif char == quote_char:
-            return False, None
-        return in_quotes, quote_char
-
     def click(self, selector: str, timeout: int = 10000) -> None:
         """Click an element with automatic fallback strategies.
 
@@ -136,24 +141,28 @@ class BrowserInteractor:
         if not is_valid:
             raise Exception(f"Invalid selector: {error_msg}")
 
-        page = self.lifecycle.page
+        # Each locator call waits for the element itself, so every strategy
+        # is a single round-trip to the driver.
+        locator = self.lifecycle.page.locator(selector).first
 
         try:
-            page.click(selector, timeout=timeout)
+            locator.click(timeout=timeout)
             return
         except (PlaywrightTimeoutError, PlaywrightError):
             pass
 
+        # The first attempt already waited the full timeout; the fallbacks
+        # only probe whether the element is there now.
+        fallback_timeout = min(timeout, _FALLBACK_CLICK_TIMEOUT)
+
         try:
-            page.wait_for_selector(selector, state="attached", timeout=timeout)
-            page.click(selector, force=True, timeout=timeout)
+            locator.click(force=True, timeout=fallback_timeout)
             return
         except (PlaywrightTimeoutError, PlaywrightError):
             pass
 
         try:
-            page.wait_for_selector(selector, state="attached", timeout=timeout)
-            page.eval_on_selector(selector, "element => element.click()")
+            locator.evaluate("element => element.click()", timeout=fallback_timeout)
             return
         except PlaywrightTimeoutError:
             raise Exception(
@@ -183,13 +192,7 @@ class BrowserInteractor:
             raise Exception(f"Invalid selector: {error_msg}")
 
         try:
-            element = self.lifecycle.page.wait_for_selector(
-                selector, timeout=timeout, state="visible"
-            )
-            if element:
-                element.fill(text)
-            else:
-                raise Exception(f"Element '{selector}' not found within {timeout}ms")
+            self.lifecycle.page.locator(selector).first.fill(text, timeout=timeout)
         except PlaywrightTimeoutError:
             raise Exception(
                 f"Type timeout: input element '{selector}' not found or not visible within {timeout}ms. "
@@ -210,18 +213,10 @@ class BrowserInteractor:
         """
         try:
             page = self.lifecycle.page
-            if direction == "down":
-                page.evaluate(f"window.scrollBy(0, {amount})")
-            elif direction == "up":
-                page.evaluate(f"window.scrollBy(0, -{amount})")
-            elif direction == "page_down":
-                page.keyboard.press("PageDown")
-            elif direction == "page_up":
-                page.keyboard.press("PageUp")
-            elif direction == "bottom":
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            elif direction == "top":
-                page.evaluate("window.scrollTo(0, 0)")
+            if direction in _SCROLL_JS_DIRECTIONS:
+                page.evaluate(_SCROLL_JS, [direction, amount])
+            elif direction in _SCROLL_KEYS:
+                page.keyboard.press(_SCROLL_KEYS[direction])
             else:
                 raise Exception(f"Invalid scroll direction: {direction}")
         except PlaywrightError as e:
@@ -248,7 +243,7 @@ class BrowserInteractor:
             raise Exception(f"Invalid selector: {error_msg}")
 
         try:
-            self.lifecycle.page.wait_for_selector(selector, timeout=timeout, state=state)
+            self.lifecycle.page.locator(selector).first.wait_for(state=state, timeout=timeout)
             return True
         except PlaywrightTimeoutError:
             return False
@@ -266,27 +261,8 @@ class BrowserInteractor:
         Raises:
             Exception: If key is invalid or press fails
         """
-        supported_keys = {
-            "Enter",
-            "Escape",
-            "Tab",
-            "Space",
-            "ArrowUp",
-            "ArrowDown",
-            "ArrowLeft",
-            "ArrowRight",
-            "Backspace",
-            "Delete",
-            "Home",
-            "End",
-            "PageUp",
-            "PageDown",
-        }
-
-        if key not in supported_keys:
-            raise Exception(
-                f"Invalid key: '{key}'. Supported keys: {', '.join(sorted(supported_keys))}"
-            )
+        if key not in _SUPPORTED_KEYS:
+            raise Exception(f"Invalid key: '{key}'. Supported keys: {_SUPPORTED_KEYS_MSG}")
 
         try:
             self.lifecycle.page.keyboard.press(key)
@@ -308,13 +284,7 @@ class BrowserInteractor:
             raise Exception(f"Invalid selector: {error_msg}")
 
         try:
-            element = self.lifecycle.page.wait_for_selector(
-                selector, timeout=timeout, state="visible"
-            )
-            if element:
-                element.hover(timeout=timeout)
-            else:
-                raise Exception(f"Element '{selector}' not found within {timeout}ms")
+            self.lifecycle.page.locator(selector).first.hover(timeout=timeout)
         except PlaywrightTimeoutError:
             raise Exception(
                 f"Hover timeout: element '{selector}' not found or not visible within {timeout}ms. "
@@ -323,10 +293,23 @@ class BrowserInteractor:
         except PlaywrightError as e:
             raise Exception(f"Hover failed on '{selector}': {str(e)}")
 
-    def take_screenshot(self, path: str) -> None:
+    def take_screenshot(
+        self, path: str, full_page: bool = False, quality: Optional[int] = None
+    ) -> None:
         """Take a screenshot of the current page.
 
         Args:
-            path: File path to save screenshot
+            path: File path to save screenshot; .jpg/.jpeg paths are saved as JPEG
+            full_page: Capture the whole scrollable page instead of the viewport
+            quality: JPEG quality 0-100 (default 80), ignored for PNG
         """
-        self.lifecycle.page.screenshot(path=path, full_page=True)
+        page = self.lifecycle.page
+        if path.lower().endswith((".jpg", ".jpeg")):
+            page.screenshot(
+                path=path,
+                full_page=full_page,
+                type="jpeg",
+                quality=quality if quality is not None else _DEFAULT_JPEG_QUALITY,
+            )
+        else:
+            page.screenshot(path=path, full_page=full_page)
@@ -1,11 +1,14 @@
+import atexit
 import platform
 import subprocess
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from playwright.sync_api import (
     Browser,
     BrowserContext,
+    BrowserType,
     Page,
     Playwright,
     sync_playwright,
@@ -13,13 +16,31 @@ from playwright.sync_api import (
 
 from config import BrowserConfig
 
+_BROWSER_TYPES = ("webkit", "chromium", "firefox")
+
+# Turn off background throttling and subsystems the agent never uses.
+_CHROMIUM_ARGS = (
+    "--disable-extensions",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-dev-shm-usage",
+)
+
 
 class BrowserLifecycle:
     """Manages browser lifecycle: startup, shutdown, and process management."""
 
+    # Playwright driver and launched browsers, shared by all instances in the
+    # process. Browsers are keyed by (browser_type, headless).
+    _shared_playwright: Optional[Playwright] = None
+    _shared_browsers: Dict[Tuple[str, bool], Browser] = {}
+    _shared_lock = threading.RLock()
+
     def __init__(self, config: BrowserConfig):
         self.config = config
-        self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
@@ -58,8 +79,81 @@ class BrowserLifecycle:
         """Check if browser is running."""
         return self._is_started
 
+    @classmethod
+    def _get_playwright(cls) -> Playwright:
+        """Get the process-wide Playwright driver, starting it on first use."""
+        from utils.logger import logger
+
+        with cls._shared_lock:
+            if cls._shared_playwright is None:
+                cls._shared_playwright = sync_playwright().start()
+                atexit.register(cls.close_shared_browsers)
+                logger.info("Playwright engine started")
+            return cls._shared_playwright
+
+    @classmethod
+    def _get_browser_type(cls, name: str) -> BrowserType:
+        """Get the Playwright browser type by name.
+
+        Raises:
+            ValueError: If unknown browser type specified
+        """
+        if name not in _BROWSER_TYPES:
+            raise ValueError(f"Unknown browser type: {name}")
+        return getattr(cls._get_playwright(), name)
+
+    @staticmethod
+    def _launch_options(config: BrowserConfig) -> Dict[str, Any]:
+        """Get browser launch options for the configured browser type."""
+        options: Dict[str, Any] = {"headless": config.headless}
+        if config.browser_type == "chromium":
+            options["args"] = list(_CHROMIUM_ARGS)
+        return options
+
+    @classmethod
+    def _get_shared_browser(cls, config: BrowserConfig) -> Browser:
+        """Get the shared browser for this browser type and headless mode.
+
+        The browser is launched once per process; each task only opens a new
+        context on it, which is far cheaper than starting a browser.
+        """
+        from utils.logger import logger
+
+        key = (config.browser_type, config.headless)
+        with cls._shared_lock:
+            browser = cls._shared_browsers.get(key)
+            if browser is None or not browser.is_connected():
+                browser = cls._get_browser_type(config.browser_type).launch(
+                    **cls._launch_options(config)
+                )
+                cls._shared_browsers[key] = browser
+                logger.info(f"Launched shared {config.browser_type} browser")
+            return browser
+
+    @classmethod
+    def close_shared_browsers(cls) -> None:
+        """Close all shared browsers and stop the Playwright driver."""
+        with cls._shared_lock:
+            for browser in cls._shared_browsers.values():
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+            cls._shared_browsers.clear()
+            if cls._shared_playwright is not None:
+                try:
+                    cls._shared_playwright.stop()
+                except Exception:
+                    pass
+                cls._shared_playwright = None
+
     def start(self) -> Page:
-        """Start the browser with persistent context (saves cookies/sessions).
+        """Start a browser context.
+
+        By default a fresh context is opened on the shared browser, with
+        cookies and local storage restored from storage_state_path. With
+        persistent_context enabled the whole user data directory is kept
+        instead, at the cost of launching a dedicated browser.
 
         Returns:
             The active browser page
@@ -75,45 +169,29 @@ class BrowserLifecycle:
 
         logger.info("Starting new browser instance...")
 
-        self.config.user_data_dir.mkdir(parents=True, exist_ok=True)
-
-        self._kill_existing_processes()
-
-        if self._playwright is None:
-            self._playwright = sync_playwright().start()
-            logger.info("Playwright engine started")
-
-        if self.config.browser_type == "webkit":
-            self._context = self._playwright.webkit.launch_persistent_context(
+        viewport = {
+            "width": self.config.viewport_width,
+            "height": self.config.viewport_height,
+        }
+
+        if self.config.persistent_context:
+            self.config.user_data_dir.mkdir(parents=True, exist_ok=True)
+            self._kill_existing_processes()
+            self._context = self._get_browser_type(
+                self.config.browser_type
+            ).launch_persistent_context(
                 user_data_dir=str(self.config.user_data_dir),
-                headless=self.config.headless,
-                viewport={
-                    "width": self.config.viewport_width,
-                    "height": self.config.viewport_height,
-                },
-            )
-        elif self.config.browser_type == "chromium":
-            self._context = self._playwright.chromium.launch_persistent_context(
-                user_data_dir=str(self.config.user_data_dir),
-                headless=self.config.headless,
-                viewport={
-                    "width": self.config.viewport_width,
-                    "height": self.config.viewport_height,
-                },
-            )
-        elif self.config.browser_type == "firefox":
-            self._context = self._playwright.firefox.launch_persistent_context(
-                user_data_dir=str(self.config.user_data_dir),
-                headless=self.config.headless,
-                viewport={
-                    "width": self.config.viewport_width,
-                    "height": self.config.viewport_height,
-                },
+                viewport=viewport,
+                **self._launch_options(self.config),
             )
+            self._browser = None
         else:
-            raise ValueError(f"Unknown browser type: {self.config.browser_type}")
-
-        self._browser = None
+            storage_state = self.config.storage_state_path
+            self._browser = self._get_shared_browser(self.config)
+            self._context = self._browser.new_context(
+                viewport=viewport,
+                storage_state=str(storage_state) if storage_state.exists() else None,
+            )
 
         if len(self._context.pages) > 0:
             self._page = self._context.pages[0]
@@ -121,14 +199,25 @@ class BrowserLifecycle:
             self._page = self._context.new_page()
 
         self._is_started = True
-        logger.info(
-            f"Browser started successfully (PID: {self._context.pages[0] if self._context.pages else 'unknown'})"
-        )
+        logger.info("Browser started successfully")
 
         return self._page
 
+    def save_storage_state(self, path: Path) -> None:
+        """Save cookies and local storage of the current context to a file.
+
+        Args:
+            path: JSON file to write
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.context.storage_state(path=str(path))
+
     def stop(self) -> None:
-        """Stop the browser and clean up resources (saves session state)."""
+        """Close the browser context (saves session state).
+
+        The shared browser stays alive for the next task; it is closed by
+        close_shared_browsers() at interpreter exit.
+        """
         from utils.logger import logger
 
         if not self._is_started:
@@ -138,20 +227,19 @@ class BrowserLifecycle:
         logger.info("Stopping browser...")
 
         if self._context:
+            if not self.config.persistent_context:
+                try:
+                    self.save_storage_state(self.config.storage_state_path)
+                except Exception as e:
+                    logger.warning(f"Error saving session state: {e}")
             try:
                 self._context.close()
             except Exception as e:
                 logger.warning(f"Error closing context: {e}")
 
-        if self._playwright:
-            try:
-                self._playwright.stop()
-            except Exception as e:
-                logger.warning(f"Error stopping playwright: {e}")
-
         self._page = None
         self._context = None
-        self._playwright = None
+        self._browser = None
         self._is_started = False
         logger.info("Browser stopped successfully")
 
@@ -166,50 +254,22 @@ class BrowserLifecycle:
             system = platform.system()
             user_data_path = str(self.config.user_data_dir)
 
-            if system == "Darwin":
+            if system in ("Darwin", "Linux"):
                 try:
+                    # Exit status 1 just means no process matched.
                     result = subprocess.run(
-                        ["pgrep", "-f", user_data_path],
+                        ["pkill", "-9", "-f", user_data_path],
                         capture_output=True,
                         timeout=5,
-                        text=True,
                     )
-                    if result.stdout:
-                        pids = result.stdout.strip().split("\n")
-                        logger.info(f"Found {len(pids)} existing browser processes to kill")
-                        for pid in pids:
-                            if pid:
-                                try:
-                                    subprocess.run(["kill", "-9", pid], timeout=2)
-                                except Exception:
-                                    pass
+                    if result.returncode == 0:
+                        logger.info("Killed existing browser processes")
                 except Exception as e:
                     logger.debug(f"Could not kill existing processes: {e}")
 
-            elif system == "Linux":
-                try:
-                    result = subprocess.run(
-                        ["pgrep", "-f", user_data_path],
-                        capture_output=True,
-                        timeout=5,
-                        text=True,
-                    )
-                    if result.stdout:
-                        pids = result.stdout.strip().split("\n")
-                        for pid in pids:
-                            if pid:
-                                subprocess.run(["kill", "-9", pid], timeout=2)
-                except Exception:
-                    pass
-
             elif system == "Windows":
                 subprocess.run(
-                    ["taskkill", "/F", "/IM", "WebKitWebProcess.exe"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                subprocess.run(
-                    ["taskkill", "/F", "/IM", "chrome.exe"],
+                    ["taskkill", "/F", "/IM", "WebKitWebProcess.exe", "/IM", "chrome.exe"],
                     capture_output=True,
                     timeout=5,
                 )
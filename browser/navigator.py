@@ -1,3 +1,4 @@
+from functools import lru_cache
 from urllib.parse import urlparse
 import ipaddress
 
@@ -5,6 +6,20 @@ from playwright.sync_api import Error as PlaywrightError, TimeoutError as Playwr
 
 from browser.lifecycle import BrowserLifecycle
 
+_SAFE_PROTOCOLS = ("http://", "https://")
+_DANGEROUS_PROTOCOLS = (
+    "javascript:",
+    "data:",
+    "file:",
+    "ftp:",
+    "about:",
+    "blob:",
+    "vbscript:",
+)
+_LOCAL_HOSTNAMES = frozenset(("localhost", "127.0.0.1", "::1"))
+# Longer than any protocol prefix above.
+_SCHEME_HEAD_LENGTH = 16
+
 
 class BrowserNavigator:
     """Handles browser navigation and URL validation."""
@@ -28,7 +43,7 @@ class BrowserNavigator:
                 "Only http:// and https:// protocols are allowed."
             )
 
-        if not url.startswith(("http://", "https://")):
+        if not url.startswith(_SAFE_PROTOCOLS):
             url = f"https://{url}"
 
         try:
@@ -39,53 +54,44 @@ class BrowserNavigator:
             raise Exception(f"Navigation failed: {str(e)}")
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _is_safe_url(url: str) -> bool:
         """Check if URL has a safe protocol and isn't targeting private networks.
 
+        Results are memoized; retries and same-site navigation repeat URLs.
+
         Args:
             url: URL to validate
 
         Returns:
             True if safe (http/https or no protocol), False otherwise
         """
-        url_lower = url.lower().strip()
-
-        if "://" not in url_lower:
+        if "://" not in url:
             return True
 
-        safe_protocols = ["http://", "https://"]
+        # Only the scheme matters for the prefix checks, so lowercase just
+        # the head instead of the whole (possibly very long) URL.
+        head = url.lstrip()[:_SCHEME_HEAD_LENGTH].lower()
 
-        dangerous_protocols = [
-            "javascript:",
-            "data:",
-            "file:",
-            "ftp:",
-            "about:",
-            "blob:",
-            "vbscript:",
-        ]
+        if head.startswith(_DANGEROUS_PROTOCOLS):
+            return False
 
-        for dangerous in dangerous_protocols:
-            if url_lower.startswith(dangerous):
-                return False
+        if not head.startswith(_SAFE_PROTOCOLS):
+            return False
 
-        for safe in safe_protocols:
-            if url_lower.startswith(safe):
+        try:
+            parsed = urlparse(url)
+            if parsed.hostname:
                 try:
-                    parsed = urlparse(url)
-                    if parsed.hostname:
-                        try:
-                            ip = ipaddress.ip_address(parsed.hostname)
-                            if ip.is_private or ip.is_loopback or ip.is_link_local:
-                                return False
-                        except ValueError:
-                            if parsed.hostname.lower() in ["localhost", "127.0.0.1", "::1"]:
-                                return False
-                except Exception:
-                    pass
-                return True
-
-        return False
+                    ip = ipaddress.ip_address(parsed.hostname)
+                    if ip.is_private or ip.is_loopback or ip.is_link_local:
+                        return False
+                except ValueError:
+                    if parsed.hostname.lower() in _LOCAL_HOSTNAMES:
+                        return False
+        except Exception:
+            pass
+        return True
 
     def get_current_url(self) -> str:
         """Get the current page URL.
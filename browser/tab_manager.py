@@ -30,12 +30,15 @@ class TabManager:
             )
         return tabs
 
-    def switch_to_tab(self, tab_index: int) -> None:
+    def switch_to_tab(self, tab_index: int) -> Dict:
         """Switch to a different tab by index.
 
         Args:
             tab_index: Zero-based index of the tab to switch to
 
+        Returns:
+            Dict with index, title, url of the now active tab
+
         Raises:
             Exception: If tab index is invalid
         """
@@ -47,19 +50,25 @@ class TabManager:
                 f"Invalid tab index: {tab_index}. " f"Available tabs: 0-{len(pages)-1}"
             )
 
-        self.lifecycle._page = pages[tab_index]
+        page = pages[tab_index]
+        self.lifecycle._page = page
 
         try:
-            self.lifecycle._page.bring_to_front()
+            page.bring_to_front()
         except Exception:
             pass
 
-    def close_tab(self, tab_index: int) -> None:
+        return {"index": tab_index, "title": page.title(), "url": page.url}
+
+    def close_tab(self, tab_index: int) -> Dict:
         """Close a tab by index.
 
         Args:
             tab_index: Zero-based index of the tab to close
 
+        Returns:
+            Dict with index, title, url of the closed tab
+
         Raises:
             Exception: If tab index is invalid or trying to close the only tab
         """
@@ -77,6 +86,11 @@ class TabManager:
             )
 
         page_to_close = pages[tab_index]
+        closed = {
+            "index": tab_index,
+            "title": page_to_close.title(),
+            "url": page_to_close.url,
+        }
 
         if page_to_close == self.lifecycle.page:
             new_index = tab_index + 1 if tab_index < len(pages) - 1 else tab_index - 1
@@ -91,6 +105,8 @@ class TabManager:
         except Exception as e:
             raise Exception(f"Failed to close tab {tab_index}: {str(e)}")
 
+        return closed
+
     def get_active_tab_index(self) -> int:
         """Get the index of the currently active tab.
 
@@ -13,6 +13,8 @@ class BrowserConfig:
     viewport_width: int = 1280
     viewport_height: int = 720
     user_data_dir: Path = Path.home() / ".autobrowser" / "browser_data"
+    storage_state_path: Path = Path.home() / ".autobrowser" / "storage_state.json"
+    persistent_context: bool = False
 
 
 @dataclass
@@ -20,6 +22,8 @@ class AgentConfig:
     max_iterations: int = 50
     context_token_limit: int = 3000
     model: str = "claude-sonnet-4-20250514"
+    log_level: str = "INFO"
+    max_history_messages: int = 40
 
 
 @dataclass
@@ -40,11 +44,14 @@ class Config:
         browser = BrowserConfig(
             headless=os.getenv("BROWSER_HEADLESS", "false").lower() == "true",
             browser_type=os.getenv("BROWSER_TYPE", "webkit"),
+            persistent_context=os.getenv("BROWSER_PERSISTENT_CONTEXT", "false").lower() == "true",
         )
 
         agent = AgentConfig(
             max_iterations=int(os.getenv("MAX_ITERATIONS", "50")),
             context_token_limit=int(os.getenv("CONTEXT_TOKEN_LIMIT", "3000")),
+            log_level=os.getenv("LOG_LEVEL", "INFO"),
+            max_history_messages=int(os.getenv("MAX_HISTORY_MESSAGES", "40")),
         )
 
         return cls(
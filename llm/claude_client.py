@@ -2,8 +2,15 @@ import time
 from typing import Any, Dict, List, Optional
 
 import anthropic
+import httpx
 from anthropic.types import MessageParam, ToolParam, ToolUseBlock, TextBlock
 
+HTTP_CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=30,
+)
+
 
 class ClaudeClient:
     """Client for interacting with Claude API with tool calling."""
@@ -19,10 +26,21 @@ class ClaudeClient:
             api_key=api_key,
             timeout=timeout,
             max_retries=max_retries,
+            http_client=anthropic.DefaultHttpxClient(limits=HTTP_CONNECTION_LIMITS),
         )
         self.model = model
         self.max_retries = max_retries
 
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self.client.close()
+
+    def __enter__(self) -> "ClaudeClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def send_message(
         self,
         messages: List[MessageParam],
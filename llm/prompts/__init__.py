@@ -4,6 +4,7 @@ This module provides a modular structure for AI agent prompts.
 """
 
 from llm.prompts.coordinator import get_coordinator_prompt
+from llm.prompts.summary import get_conversation_summary_prompt
 from llm.prompts.sub_agents import (
     get_navigator_prompt,
     get_form_filler_prompt,
@@ -37,6 +38,7 @@ def get_subagent_prompt(subagent_name: str) -> str:
 
 __all__ = [
     "get_coordinator_prompt",
+    "get_conversation_summary_prompt",
     "get_subagent_prompt",
     "get_navigator_prompt",
     "get_form_filler_prompt",
@@ -34,6 +34,8 @@ You have three specialized sub-agents you can delegate to:
 - **data_reader**: Specializes in extracting and summarizing information
   - Use when: Reading tables, extracting lists, summarizing content
 
+Use delegate_batch_to_subagent instead of repeated delegate_to_subagent calls when the same kind of subtask applies to many items.
+
 ## Guidelines
 
 1. Start by observing: Get page overview first
@@ -0,0 +1,12 @@
+def get_conversation_summary_prompt() -> str:
+    """Get the system prompt used to compact old conversation history."""
+    return """You compress the history of a browser automation agent.
+
+You receive a transcript of earlier steps: tool calls, their results and page context updates.
+
+## Output Rules
+
+- Summarize in at most 10 bullet points
+- Keep: pages visited, actions that succeeded, data already extracted, selectors that failed, user decisions (confirmations, manual actions)
+- Drop: full page overviews, HTML, repeated failures of the same kind
+- NEVER invent actions that are not in the transcript"""
@@ -48,7 +48,12 @@ def browser_lifecycle(config: Config):
     browser = BrowserController(config.browser)
     try:
         browser.start()
-        logger.info(f"Browser ready! User data: {config.browser.user_data_dir}")
+        user_data = (
+            config.browser.user_data_dir
+            if config.browser.persistent_context
+            else config.browser.storage_state_path
+        )
+        logger.info(f"Browser ready! User data: {user_data}")
         yield browser
     finally:
         try:
@@ -100,14 +105,16 @@ def main() -> None:
     try:
         logger.info("Loading configuration...")
         config = Config.from_env()
+        logger.set_level(config.agent.log_level)
+
+        claude_client = ClaudeClient(
+            api_key=config.anthropic_api_key,
+            model=config.agent.model
+        )
 
         logger.info("Starting browser (WebKit)...")
-        with browser_lifecycle(config) as browser:
+        with browser_lifecycle(config) as browser, claude_client:
             context_manager = ContextManager(browser, config.agent.context_token_limit)
-            claude_client = ClaudeClient(
-                api_key=config.anthropic_api_key,
-                model=config.agent.model
-            )
 
             logger.info("Initializing sub-agents...")
             subagents = create_subagents(claude_client, browser, context_manager)
@@ -0,0 +1,48 @@
+import unittest
+
+try:
+    from agent.coordinator import Coordinator
+except ImportError as e:  # anthropic / playwright not installed
+    raise unittest.SkipTest(f"coordinator dependencies missing: {e}")
+
+
+SAMPLE_OVERVIEW = """URL: https://example.com
+Title: Example
+
+Interactive Elements:
+
+BUTTONS:
+  - Search (button#search)
+  - Sign in (button.btn.primary)
+
+LINKS:
+  - Home (a)
+  ... and 15 more
+
+TEXTBOXS:
+  - Query (value: shoes) (input#q)
+
+HEADINGS:
+  - Delivery
+NOTE:
+orders ship in 2 days (h2)
+  - Returns (h2)"""
+
+
+class CountElementsTest(unittest.TestCase):
+    def test_counts_sections_of_sample_overview(self):
+        self.assertEqual(
+            Coordinator._count_elements(None, SAMPLE_OVERVIEW),
+            [("BUTTON", 2), ("LINK", 16), ("TEXTBOX", 1), ("HEADING", 2)],
+        )
+
+    def test_all_caps_line_without_plural_is_not_a_header(self):
+        counts = dict(Coordinator._count_elements(None, SAMPLE_OVERVIEW))
+        self.assertNotIn("NOTE", counts)
+
+    def test_empty_overview(self):
+        self.assertEqual(Coordinator._count_elements(None, ""), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
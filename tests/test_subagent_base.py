@@ -0,0 +1,31 @@
+import unittest
+
+try:
+    from agent.subagents.base import SubAgent
+except ImportError as e:  # anthropic / playwright not installed
+    raise unittest.SkipTest(f"sub-agent dependencies missing: {e}")
+
+
+class ParseBatchResultsTest(unittest.TestCase):
+    def test_trailing_array_after_bracketed_footnote(self):
+        response = 'Checked both items [1], see notes.\n["price: $10", "price: $12"]'
+        self.assertEqual(
+            SubAgent._parse_batch_results(response, 2),
+            ["price: $10", "price: $12"],
+        )
+
+    def test_wrong_length_array(self):
+        self.assertIsNone(SubAgent._parse_batch_results('["only one"]', 2))
+
+    def test_non_string_items_are_json_encoded(self):
+        self.assertEqual(
+            SubAgent._parse_batch_results('Done: ["a", 3, {"k": [1]}]', 3),
+            ["a", "3", '{"k": [1]}'],
+        )
+
+    def test_no_array(self):
+        self.assertIsNone(SubAgent._parse_batch_results("No results found.", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
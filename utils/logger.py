@@ -1,4 +1,5 @@
-from typing import Optional
+import logging
+from typing import Optional, Union
 
 from rich.console import Console
 from rich.panel import Panel
@@ -8,8 +9,30 @@ from rich import box
 class AgentLogger:
     """Pretty terminal logging for agent actions."""
 
-    def __init__(self):
+    def __init__(self, level: int = logging.INFO):
         self.console = Console()
+        self.level = level
+
+    def set_level(self, level: Union[int, str]) -> None:
+        """Set the minimum level for debug/info/warning/error messages.
+
+        Args:
+            level: A stdlib logging level or its name (e.g. "WARNING")
+        """
+        if isinstance(level, str):
+            resolved = logging.getLevelName(level.upper())
+            if not isinstance(resolved, int):
+                raise ValueError(f"Unknown log level: {level}")
+            level = resolved
+        self.level = level
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check if messages at the given level would be printed.
+
+        debug/info/warning/error also accept %-style args, which are only
+        formatted when the message is printed.
+        """
+        return level >= self.level
 
     def header(self, text: str) -> None:
         """Print a header."""
@@ -31,6 +54,9 @@ class AgentLogger:
         self, agent: str, tool: str, args: dict, reasoning: Optional[str] = None
     ) -> None:
         """Log an agent action."""
+        if self.level > logging.INFO:
+            return
+
         args_str = ", ".join(f"{k}={v}" for k, v in args.items())
         action_text = f"[yellow]{tool}[/yellow]({args_str})"
 
@@ -141,12 +167,28 @@ class AgentLogger:
 
         return f"HTML extracted: {len(html)} chars"
 
-    def error(self, error: str) -> None:
+    def error(self, error: str, *args) -> None:
         """Log an error."""
+        if self.level > logging.ERROR:
+            return
+        if args:
+            error = error % args
         self.console.print(f"  [bold red]❌ Error: {error}[/bold red]")
 
-    def info(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
+        """Log a debug message."""
+        if self.level > logging.DEBUG:
+            return
+        if args:
+            message = message % args
+        self.console.print(f"  [dim]· {message}[/dim]")
+
+    def info(self, message: str, *args) -> None:
         """Log an info message."""
+        if self.level > logging.INFO:
+            return
+        if args:
+            message = message % args
         self.console.print(f"  [dim]ℹ {message}[/dim]")
 
     def success(self, summary: str) -> None:
@@ -217,8 +259,12 @@ class AgentLogger:
         self.console.print(f"[bold magenta]← {subagent} completed[/bold magenta]")
         self.console.print(f"  [dim]Result: {result}[/dim]")
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log a warning."""
+        if self.level > logging.WARNING:
+            return
+        if args:
+            message = message % args
         self.console.print(f"  [yellow]⚠ {message}[/yellow]")
 
     def separator(self) -> None: